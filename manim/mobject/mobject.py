@@ -294,8 +294,13 @@ class Mobject(Container):
     def shift(self, *vectors):
         total_vector = reduce(op.add, vectors)
         for mob in self.family_members_with_points():
-            mob.points = mob.points.astype("float")
-            mob.points += total_vector
+            # A new array is made, since the points may be shared
+            # with another mobject, but float points keep their
+            # precision, e.g. float32
+            points = mob.points + total_vector
+            if np.issubdtype(mob.points.dtype, np.floating):
+                points = points.astype(mob.points.dtype, copy=False)
+            mob.points = points
         return self
 
     def scale(self, scale_factor, **kwargs):
@@ -413,8 +418,12 @@ class Mobject(Container):
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
         for mob in self.family_members_with_points():
+            dtype = mob.points.dtype
             mob.points -= about_point
             mob.points = func(mob.points)
+            # Keep the precision float points had, e.g. float32
+            if np.issubdtype(dtype, np.floating):
+                mob.points = mob.points.astype(dtype, copy=False)
             mob.points += about_point
         return self
 
@@ -973,8 +982,14 @@ class Mobject(Container):
         return result + self.submobjects
 
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
+        # Walk the tree once, in the same order as recursing through
+        # each submobject's family, and remove repeats only at the end
+        all_mobjects = []
+        to_visit = [self]
+        while to_visit:
+            mob = to_visit.pop()
+            all_mobjects.append(mob)
+            to_visit.extend(reversed(mob.submobjects))
         return remove_list_redundancies(all_mobjects)
 
     def family_members_with_points(self):
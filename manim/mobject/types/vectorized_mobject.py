@@ -11,7 +11,7 @@ __all__ = [
 ]
 
 
-import itertools as it
+import copy
 import sys
 
 from colour import Color
@@ -24,13 +24,13 @@ from ...utils.bezier import get_smooth_handle_points
 from ...utils.bezier import interpolate
 from ...utils.bezier import integer_interpolate
 from ...utils.bezier import partial_bezier_points
-from ...utils.color import color_to_rgba, BLACK, WHITE
+from ...utils.bezier import partial_bezier_points_batch
+from ...utils.color import color_to_rgb, BLACK, WHITE
 from ...utils.iterables import make_even
 from ...utils.iterables import stretch_array_to_length
 from ...utils.iterables import tuplify
-from ...utils.simple_functions import clip_in_place
+from ...utils.simple_functions import choose
 from ...utils.space_ops import rotate_vector
-from ...utils.space_ops import get_norm
 
 # TODO
 # - Change cubic curve groups to have 4 points instead of 3
@@ -40,6 +40,15 @@ from ...utils.space_ops import get_norm
 # - Think about length of self.points.  Always 0 or 1 mod 4?
 #   That's kind of weird.
 
+# Attributes which align_rgbas and interpolate_color work through
+RGBA_ARRAY_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+INTERPOLATED_STYLE_ATTRS = RGBA_ARRAY_ATTRS + (
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_direction",
+    "sheen_factor",
+)
+
 
 class VMobject(Mobject):
     CONFIG = {
@@ -72,6 +81,9 @@ class VMobject(Mobject):
         # varying zoom levels?
         "tolerance_for_point_equality": 1e-6,
         "n_points_per_cubic_curve": 4,
+        # Passing np.float32 halves the memory taken up by points,
+        # at the cost of precision close to tolerance_for_point_equality
+        "points_dtype": np.float64,
     }
 
     def get_group_class(self):
@@ -101,32 +113,53 @@ class VMobject(Mobject):
 
     def generate_rgbas_array(self, color, opacity):
         """
-        First arg can be either a color, or a tuple/list of colors.
+        First arg can be either a color, a tuple/list of colors,
+        or an array of rgb values.
         Likewise, opacity can either be a float, or a tuple of floats.
         If self.sheen_factor is not zero, and only
         one color was passed in, a second slightly light color
         will automatically be added for the gradient
         """
-        colors = list(tuplify(color))
-        opacities = list(tuplify(opacity))
-        rgbas = np.array(
-            [color_to_rgba(c, o) for c, o in zip(*make_even(colors, opacities))]
-        )
-
         sheen_factor = self.get_sheen_factor()
-        if sheen_factor != 0 and len(rgbas) == 1:
-            light_rgbas = np.array(rgbas)
-            light_rgbas[:, :3] += sheen_factor
-            clip_in_place(light_rgbas, 0, 1)
-            rgbas = np.append(rgbas, light_rgbas, axis=0)
+        if isinstance(color, (str, Color)) and isinstance(opacity, (int, float)):
+            # Common case of a single color and opacity, which
+            # needs none of the stretching below
+            rgbas = np.empty((2 if sheen_factor != 0 else 1, 4))
+            rgbas[:, :3] = color_to_rgb(color)
+            rgbas[:, 3] = opacity
+            if sheen_factor != 0:
+                rgbas[1, :3] += sheen_factor
+                np.clip(rgbas[1], 0, 1, out=rgbas[1])
+            return rgbas
+        if isinstance(color, np.ndarray) and color.dtype.kind in "fiu":
+            # Arrays of rgb values, e.g. as passed by match_style
+            rgbs = color.reshape((-1, 3))
+        else:
+            rgbs = np.array([color_to_rgb(c) for c in tuplify(color)])
+        opacities = np.array(tuplify(opacity), dtype=float)
+        # Same stretching as make_even, but done on whole arrays
+        length = max(len(rgbs), len(opacities))
+        rgbas = np.empty((length, 4))
+        rgbas[:, :3] = rgbs[(np.arange(length) * len(rgbs)) // length]
+        rgbas[:, 3] = opacities[(np.arange(length) * len(opacities)) // length]
+
+        if sheen_factor != 0 and length == 1:
+            light_rgbas = np.empty((2, 4))
+            light_rgbas[0] = rgbas[0]
+            light_rgbas[1] = rgbas[0]
+            light_rgbas[1, :3] += sheen_factor
+            np.clip(light_rgbas[1], 0, 1, out=light_rgbas[1])
+            rgbas = light_rgbas
         return rgbas
 
-    def update_rgbas_array(self, array_name, color=None, opacity=None):
-        passed_color = color if (color is not None) else BLACK
-        passed_opacity = opacity if (opacity is not None) else 0
-        rgbas = self.generate_rgbas_array(passed_color, passed_opacity)
+    def update_rgbas_array(self, array_name, color=None, opacity=None, rgbas=None):
+        if rgbas is None:
+            passed_color = color if (color is not None) else BLACK
+            passed_opacity = opacity if (opacity is not None) else 0
+            rgbas = self.generate_rgbas_array(passed_color, passed_opacity)
         if not hasattr(self, array_name):
-            setattr(self, array_name, rgbas)
+            # Copy, since rgbas may be shared by a whole family
+            setattr(self, array_name, np.array(rgbas))
             return self
         # Match up current rgbas array with the newly calculated
         # one. 99% of the time they'll be the same.
@@ -144,28 +177,45 @@ class VMobject(Mobject):
             curr_rgbas[:, 3] = rgbas[:, 3]
         return self
 
+    def update_family_rgbas_array(self, mobs, array_name, color=None, opacity=None):
+        """
+        Same as calling update_rgbas_array on each of mobs, but the
+        rgbas array is only generated once for each distinct sheen
+        factor, rather than once per mobject.
+        """
+        passed_color = color if (color is not None) else BLACK
+        passed_opacity = opacity if (opacity is not None) else 0
+        rgbas_by_sheen_factor = {}
+        for mob in mobs:
+            sheen_factor = mob.get_sheen_factor()
+            if sheen_factor not in rgbas_by_sheen_factor:
+                rgbas_by_sheen_factor[sheen_factor] = mob.generate_rgbas_array(
+                    passed_color, passed_opacity
+                )
+            mob.update_rgbas_array(
+                array_name, color, opacity, rgbas_by_sheen_factor[sheen_factor]
+            )
+        return self
+
     def set_fill(self, color=None, opacity=None, family=True):
-        if family:
-            for submobject in self.submobjects:
-                submobject.set_fill(color, opacity, family)
-        self.update_rgbas_array("fill_rgbas", color, opacity)
+        mobs = self.get_family() if family else [self]
+        self.update_family_rgbas_array(mobs, "fill_rgbas", color, opacity)
         return self
 
     def set_stroke(
         self, color=None, width=None, opacity=None, background=False, family=True
     ):
-        if family:
-            for submobject in self.submobjects:
-                submobject.set_stroke(color, width, opacity, background, family)
         if background:
             array_name = "background_stroke_rgbas"
             width_name = "background_stroke_width"
         else:
             array_name = "stroke_rgbas"
             width_name = "stroke_width"
-        self.update_rgbas_array(array_name, color, opacity)
+        mobs = self.get_family() if family else [self]
+        self.update_family_rgbas_array(mobs, array_name, color, opacity)
         if width is not None:
-            setattr(self, width_name, width)
+            for mob in mobs:
+                setattr(mob, width_name, width)
         return self
 
     def set_background_stroke(self, **kwargs):
@@ -211,14 +261,27 @@ class VMobject(Mobject):
             self.color_using_background_image(background_image_file)
         return self
 
-    def get_style(self):
+    def get_style(self, as_rgbs=False):
+        """
+        If as_rgbs is True, colors are given as arrays of rgb values
+        rather than as lists of Color objects. This is much cheaper,
+        and set_style accepts either form.
+        """
+        if as_rgbs:
+            fill_colors = self.get_fill_rgbas()[:, :3]
+            stroke_colors = self.get_stroke_rgbas()[:, :3]
+            background_stroke_colors = self.get_stroke_rgbas(background=True)[:, :3]
+        else:
+            fill_colors = self.get_fill_colors()
+            stroke_colors = self.get_stroke_colors()
+            background_stroke_colors = self.get_stroke_colors(background=True)
         return {
-            "fill_color": self.get_fill_colors(),
+            "fill_color": fill_colors,
             "fill_opacity": self.get_fill_opacities(),
-            "stroke_color": self.get_stroke_colors(),
+            "stroke_color": stroke_colors,
             "stroke_width": self.get_stroke_width(),
             "stroke_opacity": self.get_stroke_opacity(),
-            "background_stroke_color": self.get_stroke_colors(background=True),
+            "background_stroke_color": background_stroke_colors,
             "background_stroke_width": self.get_stroke_width(background=True),
             "background_stroke_opacity": self.get_stroke_opacity(background=True),
             "sheen_factor": self.get_sheen_factor(),
@@ -227,7 +290,7 @@ class VMobject(Mobject):
         }
 
     def match_style(self, vmobject, family=True):
-        self.set_style(**vmobject.get_style(), family=False)
+        self.set_style(**vmobject.get_style(as_rgbs=True), family=False)
 
         if family:
             # Does its best to match up submobject lists, and
@@ -339,14 +402,11 @@ class VMobject(Mobject):
         return self
 
     def set_sheen(self, factor, direction=None, family=True):
-        if family:
-            for submob in self.submobjects:
-                submob.set_sheen(factor, direction, family)
-        self.sheen_factor = factor
+        mobs = self.get_family() if family else [self]
+        for mob in mobs:
+            mob.sheen_factor = factor
         if direction is not None:
-            # family set to false because recursion will
-            # already be handled above
-            self.set_sheen_direction(direction, family=False)
+            self.set_sheen_direction(direction, family=family)
         # Reset color to put sheen_factor into effect
         if factor != 0:
             self.set_stroke(self.get_stroke_color(), family=family)
@@ -394,30 +454,37 @@ class VMobject(Mobject):
 
     # Points
     def set_points(self, points):
-        self.points = np.array(points)
+        self.points = np.array(points, dtype=self.points_dtype)
         return self
 
     def get_points(self):
+        """
+        Returns a copy of the points, safe for the caller to modify.
+        Methods which only read the points should use self.points
+        directly to avoid the copy.
+        """
         return np.array(self.points)
 
     def set_anchors_and_handles(self, anchors1, handles1, handles2, anchors2):
         assert len(anchors1) == len(handles1) == len(handles2) == len(anchors2)
         nppcc = self.n_points_per_cubic_curve  # 4
         total_len = nppcc * len(anchors1)
-        self.points = np.zeros((total_len, self.dim))
+        self.points = np.zeros((total_len, self.dim), dtype=self.points_dtype)
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
             self.points[index::nppcc] = array
         return self
 
     def clear_points(self):
-        self.points = np.zeros((0, self.dim))
+        self.points = np.zeros((0, self.dim), dtype=self.points_dtype)
 
     def append_points(self, new_points):
         # TODO, check that number new points is a multiple of 4?
         # or else that if len(self.points) % 4 == 1, then
         # len(new_points) % 4 == 3?
-        self.points = np.append(self.points, new_points, axis=0)
+        self.points = np.append(self.points, new_points, axis=0).astype(
+            self.points_dtype, copy=False
+        )
         return self
 
     def start_new_path(self, point):
@@ -441,13 +508,8 @@ class VMobject(Mobject):
             self.append_points([self.get_last_point()] + new_points)
 
     def add_line_to(self, point):
-        nppcc = self.n_points_per_cubic_curve
-        self.add_cubic_bezier_curve_to(
-            *[
-                interpolate(self.get_last_point(), point, a)
-                for a in np.linspace(0, 1, nppcc)[1:]
-            ]
-        )
+        line_points = self.get_line_points_from_corners([self.get_last_point(), point])
+        self.add_cubic_bezier_curve_to(*line_points[1:])
         return self
 
     def add_smooth_curve_to(self, *points):
@@ -489,16 +551,44 @@ class VMobject(Mobject):
         return self.consider_points_equals(self.points[0], self.points[-1])
 
     def add_points_as_corners(self, points):
-        for point in points:
-            self.add_line_to(point)
+        if len(points) == 0:
+            return points
+        self.throw_error_if_no_points()
+        # Same as calling add_line_to for each point,
+        # but appending all the new curves at once
+        corners = np.append([self.get_last_point()], points, axis=0)
+        new_points = self.get_line_points_from_corners(corners)
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return points
 
-    def set_points_as_corners(self, points):
+    def get_line_points_from_corners(self, corners):
+        """
+        Returns the points of the straight cubic curves
+        running from each of the corners to the next one.
+        """
         nppcc = self.n_points_per_cubic_curve
-        points = np.array(points)
-        self.set_anchors_and_handles(
-            *[interpolate(points[:-1], points[1:], a) for a in np.linspace(0, 1, nppcc)]
+        corners = np.array(corners)
+        if len(corners) == 0:
+            return np.zeros((0, self.dim))
+        starts = corners[:-1]
+        ends = corners[1:]
+        # Shape (num_curves, nppcc, dim).  The anchors are copied
+        # in as they are, and only the handles in between are
+        # computed, all at once through broadcasting
+        curves = np.empty((len(starts), nppcc) + corners.shape[1:])
+        curves[:, 0] = starts
+        curves[:, -1] = ends
+        alphas = np.arange(1, nppcc - 1)[:, np.newaxis] / (nppcc - 1)
+        curves[:, 1:-1] = (
+            starts[:, np.newaxis] + alphas * (ends - starts)[:, np.newaxis]
         )
+        return curves.reshape((-1,) + corners.shape[1:])
+
+    def set_points_as_corners(self, points):
+        new_points = self.get_line_points_from_corners(points)
+        self.points = new_points.astype(self.points_dtype, copy=False)
         return self
 
     def set_points_smoothly(self, points):
@@ -510,9 +600,8 @@ class VMobject(Mobject):
         assert mode in ["jagged", "smooth"]
         nppcc = self.n_points_per_cubic_curve
         for submob in self.family_members_with_points():
-            subpaths = submob.get_subpaths()
-            submob.clear_points()
-            for subpath in subpaths:
+            new_subpaths = []
+            for subpath in submob.get_subpaths():
                 anchors = np.append(subpath[::nppcc], subpath[-1:], 0)
                 if mode == "smooth":
                     h1, h2 = get_smooth_handle_points(anchors)
@@ -524,7 +613,12 @@ class VMobject(Mobject):
                 new_subpath = np.array(subpath)
                 new_subpath[1::nppcc] = h1
                 new_subpath[2::nppcc] = h2
-                submob.append_points(new_subpath)
+                new_subpaths.append(new_subpath)
+            # Append all subpaths at once, rather than
+            # reallocating the points array for each of them
+            submob.clear_points()
+            if new_subpaths:
+                submob.append_points(np.concatenate(new_subpaths))
         return self
 
     def make_smooth(self):
@@ -535,7 +629,9 @@ class VMobject(Mobject):
 
     def add_subpath(self, points):
         assert len(points) % 4 == 0
-        self.points = np.append(self.points, points, axis=0)
+        self.points = np.append(self.points, points, axis=0).astype(
+            self.points_dtype, copy=False
+        )
         return self
 
     def append_vectorized_mobject(self, vectorized_mobject):
@@ -566,20 +662,42 @@ class VMobject(Mobject):
         handles closer to their anchors, apply the function then push them out
         again.
         """
+        nppcc = self.n_points_per_cubic_curve
         for submob in self.family_members_with_points():
-            if len(submob.points) < self.n_points_per_cubic_curve:
+            if len(submob.points) < nppcc:
                 continue
+            # The points array may be shared with another mobject
+            # (Homotopy does this), so work on a copy.  The anchors
+            # and handles are views into that copy, so updating
+            # them in place updates the new points.  Integer points
+            # are made float, so they can be scaled in place.
+            dtype = submob.points.dtype
+            if not np.issubdtype(dtype, np.floating):
+                dtype = submob.points_dtype
+            submob.points = np.array(submob.points, dtype=dtype)
             a1, h1, h2, a2 = submob.get_anchors_and_handles()
-            a1_to_h1 = h1 - a1
-            a2_to_h2 = h2 - a2
-            new_h1 = a1 + factor * a1_to_h1
-            new_h2 = a2 + factor * a2_to_h2
-            submob.set_anchors_and_handles(a1, new_h1, new_h2, a2)
+            h1 -= a1
+            h1 *= factor
+            h1 += a1
+            h2 -= a2
+            h2 *= factor
+            h2 += a2
         return self
 
     #
     def consider_points_equals(self, p0, p1):
-        return np.allclose(p0, p1, atol=self.tolerance_for_point_equality)
+        """
+        Determine if two points are close enough to be considered equal.
+
+        This is the same test as np.allclose(), but done component by
+        component, as np.allclose() has a lot of overhead for single points.
+        """
+        rtol = 1.0e-5  # default from np.allclose()
+        atol = self.tolerance_for_point_equality
+        for x0, x1 in zip(p0, p1):
+            if abs(x0 - x1) > atol + rtol * abs(x1):
+                return False
+        return True
 
     def consider_points_equals_2d(self, p0, p1):
         """
@@ -598,48 +716,55 @@ class VMobject(Mobject):
 
     # Information about line
     def get_cubic_bezier_tuples_from_points(self, points):
-        return np.array(list(self.gen_cubic_bezier_tuples_from_points(points)))
-
-    def gen_cubic_bezier_tuples_from_points(self, points):
         """
-        Get a generator for the cubic bezier tuples of this object.
+        Returns an array of shape (num_curves, nppcc, dim).
 
-        Generator to not materialize a list or np.array needlessly.
+        This is a view into points when points is a contiguous
+        array, and a copy otherwise, so it shouldn't be written to.
         """
-        nppcc = VMobject.CONFIG["n_points_per_cubic_curve"]
+        nppcc = self.n_points_per_cubic_curve
+        points = np.asarray(points)
         remainder = len(points) % nppcc
         points = points[: len(points) - remainder]
-        return (points[i : i + nppcc] for i in range(0, len(points), nppcc))
+        return points.reshape((-1, nppcc) + points.shape[1:])
+
+    def gen_cubic_bezier_tuples_from_points(self, points):
+        """
+        Get a generator for the cubic bezier tuples of this object.
+        """
+        return iter(self.get_cubic_bezier_tuples_from_points(points))
 
     def get_cubic_bezier_tuples(self):
-        return self.get_cubic_bezier_tuples_from_points(self.get_points())
+        return np.array(self.get_cubic_bezier_tuples_from_points(self.points))
 
-    def _gen_subpaths_from_points(self, points, filter_func):
+    def _gen_subpaths_from_points(self, points, n_dims=None):
+        """
+        Splits points into subpaths wherever the end of one curve is not
+        close to the start of the next.  Closeness is the same test as
+        np.isclose(), run on all curve boundaries at once, and looking
+        only at the first n_dims coordinates (all of them if None).
+        """
         nppcc = self.n_points_per_cubic_curve
-        split_indices = filter(filter_func, range(nppcc, len(points), nppcc))
-        split_indices = [0] + list(split_indices) + [len(points)]
+        rtol = 1.0e-5  # default from np.isclose()
+        atol = self.tolerance_for_point_equality
+        boundary_indices = np.arange(nppcc, len(points), nppcc)
+        ends = points[boundary_indices - 1, :n_dims]
+        starts = points[boundary_indices, :n_dims]
+        is_split = np.any(np.abs(ends - starts) > atol + rtol * np.abs(starts), axis=1)
         return (
-            points[i1:i2]
-            for i1, i2 in zip(split_indices, split_indices[1:])
-            if (i2 - i1) >= nppcc
+            subpath
+            for subpath in np.split(points, boundary_indices[is_split])
+            if len(subpath) >= nppcc
         )
 
     def get_subpaths_from_points(self, points):
-        return list(
-            self._gen_subpaths_from_points(
-                points,
-                lambda n: not self.consider_points_equals(points[n - 1], points[n]),
-            )
-        )
+        return list(self._gen_subpaths_from_points(points))
 
     def gen_subpaths_from_points_2d(self, points):
-        return self._gen_subpaths_from_points(
-            points,
-            lambda n: not self.consider_points_equals_2d(points[n - 1], points[n]),
-        )
+        return self._gen_subpaths_from_points(points, n_dims=2)
 
     def get_subpaths(self):
-        return self.get_subpaths_from_points(self.get_points())
+        return self.get_subpaths_from_points(self.points)
 
     def get_nth_curve_points(self, n):
         assert n < self.get_num_curves()
@@ -656,8 +781,35 @@ class VMobject(Mobject):
     def point_from_proportion(self, alpha):
         num_cubics = self.get_num_curves()
         n, residue = integer_interpolate(0, num_cubics, alpha)
-        curve = self.get_nth_curve_function(n)
-        return curve(residue)
+        # Evaluate the curve directly, rather than building
+        # a bezier function just to call it once
+        degree = self.n_points_per_cubic_curve - 1
+        return sum(
+            choose(degree, k) * (1 - residue) ** (degree - k) * residue ** k * point
+            for k, point in enumerate(self.get_nth_curve_points(n))
+        )
+
+    def points_from_proportions(self, alphas):
+        """
+        Same as calling point_from_proportion for each of alphas,
+        but with all the points computed at once.
+        """
+        nppcc = self.n_points_per_cubic_curve
+        bezier_quads = self.get_cubic_bezier_tuples_from_points(self.points)
+        num_cubics = len(bezier_quads)
+        # Same curve index and residue as integer_interpolate
+        # would give for each alpha
+        scaled_alphas = num_cubics * np.clip(alphas, 0, 1)
+        indices = np.clip(scaled_alphas.astype(int), 0, num_cubics - 1)
+        residues = (scaled_alphas - indices)[:, np.newaxis]
+        degree = nppcc - 1
+        return sum(
+            choose(degree, k)
+            * (1 - residues) ** (degree - k)
+            * residues ** k
+            * bezier_quads[indices, k]
+            for k in range(nppcc)
+        )
 
     def get_anchors_and_handles(self):
         """
@@ -670,7 +822,8 @@ class VMobject(Mobject):
         return [self.points[i::nppcc] for i in range(nppcc)]
 
     def get_start_anchors(self):
-        return self.points[0 :: self.n_points_per_cubic_curve]
+        nppcc = self.n_points_per_cubic_curve
+        return self.points[0::nppcc]
 
     def get_end_anchors(self):
         nppcc = self.n_points_per_cubic_curve
@@ -679,28 +832,23 @@ class VMobject(Mobject):
     def get_anchors(self):
         if self.points.shape[0] == 1:
             return self.points
-        return np.array(
-            list(
-                it.chain(
-                    *zip(
-                        self.get_start_anchors(),
-                        self.get_end_anchors(),
-                    )
-                )
-            )
-        )
+        end_anchors = self.get_end_anchors()
+        num_curves = len(end_anchors)
+        # Interleave start and end anchors
+        anchors = np.empty((2 * num_curves, self.dim))
+        anchors[0::2] = self.get_start_anchors()[:num_curves]
+        anchors[1::2] = end_anchors
+        return anchors
 
     def get_points_defining_boundary(self):
-        return np.array(list(it.chain(*[sm.get_anchors() for sm in self.get_family()])))
+        return np.concatenate([sm.get_anchors() for sm in self.get_family()])
 
     def get_arc_length(self, n_sample_points=None):
         if n_sample_points is None:
             n_sample_points = 4 * self.get_num_curves() + 1
-        points = np.array(
-            [self.point_from_proportion(a) for a in np.linspace(0, 1, n_sample_points)]
-        )
+        points = self.points_from_proportions(np.linspace(0, 1, n_sample_points))
         diffs = points[1:] - points[:-1]
-        norms = np.apply_along_axis(get_norm, 1, diffs)
+        norms = np.linalg.norm(diffs, axis=1)
         return np.sum(norms)
 
     # Alignment
@@ -723,9 +871,9 @@ class VMobject(Mobject):
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
+        # Start building new ones, to be joined together at the end
+        new_subpaths1 = [np.zeros((0, self.dim))]
+        new_subpaths2 = [np.zeros((0, self.dim))]
 
         nppcc = self.n_points_per_cubic_curve
 
@@ -740,12 +888,14 @@ class VMobject(Mobject):
             sp2 = get_nth_subpath(subpaths2, n)
             diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
             diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
+            new_subpaths1.append(self.insert_n_curves_to_point_list(diff1, sp1))
+            new_subpaths2.append(self.insert_n_curves_to_point_list(diff2, sp2))
+        self.points = np.concatenate(new_subpaths1).astype(
+            self.points_dtype, copy=False
+        )
+        vmobject.points = np.concatenate(new_subpaths2).astype(
+            vmobject.points_dtype, copy=False
+        )
         return self
 
     def insert_n_curves(self, n):
@@ -753,7 +903,7 @@ class VMobject(Mobject):
         if self.has_new_path_started():
             new_path_point = self.get_last_point()
 
-        new_points = self.insert_n_curves_to_point_list(n, self.get_points())
+        new_points = self.insert_n_curves_to_point_list(n, self.points)
         self.set_points(new_points)
 
         if new_path_point is not None:
@@ -761,11 +911,13 @@ class VMobject(Mobject):
         return self
 
     def insert_n_curves_to_point_list(self, n, points):
+        nppcc = self.n_points_per_cubic_curve
         if len(points) == 1:
-            nppcc = self.n_points_per_cubic_curve
             return np.repeat(points, nppcc * n, 0)
         bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
         curr_num = len(bezier_quads)
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
         target_num = curr_num + n
         # This is an array with values ranging from 0
         # up to curr_num,  with repeats such that
@@ -778,29 +930,31 @@ class VMobject(Mobject):
         # that the nth curve of our path should be split
         # into k pieces.  In the above example, this would
         # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points, partial_bezier_points(quad, a1, a2), axis=0
-                )
-        return new_points
+        split_factors = np.bincount(repeat_indices, minlength=curr_num)
+        # What was once a single cubic curve defined by
+        # a quad will now be broken into sf smaller cubic
+        # curves, running over the intervals [k / sf, (k + 1) / sf].
+        # These are computed for all new curves at once.
+        sfs = split_factors[repeat_indices]
+        first_indices = np.cumsum(split_factors) - split_factors
+        ks = np.arange(target_num) - first_indices[repeat_indices]
+        new_quads = partial_bezier_points_batch(
+            bezier_quads[repeat_indices], ks / sfs, (ks + 1) / sfs
+        )
+        return new_quads.reshape((-1, self.dim))
 
     def align_rgbas(self, vmobject):
-        attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
-        for attr in attrs:
+        for attr in RGBA_ARRAY_ATTRS:
             a1 = getattr(self, attr)
             a2 = getattr(vmobject, attr)
-            if len(a1) > len(a2):
-                new_a2 = stretch_array_to_length(a2, len(a1))
+            len1, len2 = len(a1), len(a2)
+            if len1 == len2:
+                continue
+            if len1 > len2:
+                new_a2 = stretch_array_to_length(a2, len1)
                 setattr(vmobject, attr, new_a2)
-            elif len(a2) > len(a1):
-                new_a1 = stretch_array_to_length(a1, len(a2))
+            else:
+                new_a1 = stretch_array_to_length(a1, len2)
                 setattr(self, attr, new_a1)
         return self
 
@@ -812,25 +966,23 @@ class VMobject(Mobject):
         return point
 
     def interpolate_color(self, mobject1, mobject2, alpha):
-        attrs = [
-            "fill_rgbas",
-            "stroke_rgbas",
-            "background_stroke_rgbas",
-            "stroke_width",
-            "background_stroke_width",
-            "sheen_direction",
-            "sheen_factor",
-        ]
-        for attr in attrs:
+        if alpha == 1.0:
+            for attr in INTERPOLATED_STYLE_ATTRS:
+                setattr(self, attr, getattr(mobject2, attr))
+            return
+        for attr in INTERPOLATED_STYLE_ATTRS:
             setattr(
                 self,
                 attr,
                 interpolate(getattr(mobject1, attr), getattr(mobject2, attr), alpha),
             )
-            if alpha == 1.0:
-                setattr(self, attr, getattr(mobject2, attr))
 
-    def pointwise_become_partial(self, vmobject, a, b):
+    def pointwise_become_partial(self, vmobject, a, b, bezier_quads=None):
+        """
+        bezier_quads can be passed in when it has already been computed
+        from vmobject's points with get_cubic_bezier_tuples_from_points,
+        e.g. when taking many partials of the same vmobject.
+        """
         assert isinstance(vmobject, VMobject)
         # Partial curve includes three portions:
         # - A middle section, which matches the curve exactly
@@ -839,35 +991,51 @@ class VMobject(Mobject):
         if a <= 0 and b >= 1:
             self.set_points(vmobject.points)
             return self
-        bezier_quads = vmobject.get_cubic_bezier_tuples()
+        if bezier_quads is None:
+            bezier_quads = vmobject.get_cubic_bezier_tuples_from_points(vmobject.points)
         num_cubics = len(bezier_quads)
 
         lower_index, lower_residue = integer_interpolate(0, num_cubics, a)
         upper_index, upper_residue = integer_interpolate(0, num_cubics, b)
 
-        self.clear_points()
         if num_cubics == 0:
+            self.clear_points()
             return self
         if lower_index == upper_index:
-            self.append_points(
+            self.set_points(
                 partial_bezier_points(
                     bezier_quads[lower_index], lower_residue, upper_residue
                 )
             )
         else:
-            self.append_points(
-                partial_bezier_points(bezier_quads[lower_index], lower_residue, 1)
-            )
-            for quad in bezier_quads[lower_index + 1 : upper_index]:
-                self.append_points(quad)
-            self.append_points(
-                partial_bezier_points(bezier_quads[upper_index], 0, upper_residue)
+            start = partial_bezier_points(bezier_quads[lower_index], lower_residue, 1)
+            middle = bezier_quads[lower_index + 1 : upper_index].reshape(
+                (-1,) + bezier_quads.shape[2:]
             )
+            end = partial_bezier_points(bezier_quads[upper_index], 0, upper_residue)
+            self.set_points(np.concatenate([start, middle, end]))
         return self
 
-    def get_subcurve(self, a, b):
-        vmob = self.copy()
-        vmob.pointwise_become_partial(self, a, b)
+    def get_subcurve(self, a, b, bezier_quads=None):
+        # The points of the copy are replaced right away by
+        # VMobject.pointwise_become_partial, so rather than copying
+        # them, deepcopy is told to use an empty array.  Overrides
+        # might keep the points, and family members sharing the
+        # array still need it, so those get a full copy.
+        points_replaced = (
+            type(self).pointwise_become_partial is VMobject.pointwise_become_partial
+        )
+        points_shared = any(sm.points is self.points for sm in self.get_family()[1:])
+        if points_replaced and not points_shared:
+            memo = {id(self.points): np.zeros((0, self.dim))}
+            vmob = copy.deepcopy(self, memo)
+        else:
+            vmob = self.copy()
+        if points_replaced:
+            vmob.pointwise_become_partial(self, a, b, bezier_quads=bezier_quads)
+        else:
+            # Overrides may only take (mobject, a, b)
+            vmob.pointwise_become_partial(self, a, b)
         return vmob
 
 
@@ -1113,7 +1281,8 @@ class VectorizedPoint(VMobject):
 
     def __init__(self, location=ORIGIN, **kwargs):
         VMobject.__init__(self, **kwargs)
-        self.set_points(np.array([location]))
+        # set_points already copies, so only a reshaped view is passed in
+        self.set_points(np.reshape(location, (1, -1)))
 
     def get_width(self):
         return self.artificial_width
@@ -1122,21 +1291,28 @@ class VectorizedPoint(VMobject):
         return self.artificial_height
 
     def get_location(self):
-        return np.array(self.points[0])
+        return self.points[0].copy()
 
     def set_location(self, new_loc):
-        self.set_points(np.array([new_loc]))
+        self.set_points(np.reshape(new_loc, (1, -1)))
 
 
 class CurvesAsSubmobjects(VGroup):
     def __init__(self, vmobject, **kwargs):
         VGroup.__init__(self, **kwargs)
-        tuples = vmobject.get_cubic_bezier_tuples()
-        for tup in tuples:
+        # One copy of all the curves, whose disjoint slices
+        # become the points of each part
+        curves = vmobject.get_cubic_bezier_tuples()
+        # Same as part.match_style(vmobject), with the
+        # style of vmobject only read once
+        style = vmobject.get_style(as_rgbs=True)
+        parts = []
+        for curve in curves:
             part = VMobject()
-            part.set_points(tup)
-            part.match_style(vmobject)
-            self.add(part)
+            part.points = curve.astype(part.points_dtype, copy=False)
+            part.set_style(**style, family=False)
+            parts.append(part)
+        self.add(*parts)
 
 
 class DashedVMobject(VMobject):
@@ -1147,23 +1323,26 @@ class DashedVMobject(VMobject):
         num_dashes = self.num_dashes
         ps_ratio = self.positive_space_ratio
         if num_dashes > 0:
-            # End points of the unit interval for division
-            alphas = np.linspace(0, 1, num_dashes + 1)
-
             # This determines the length of each "dash"
             full_d_alpha = 1.0 / num_dashes
             partial_d_alpha = full_d_alpha * ps_ratio
 
-            # Rescale so that the last point of vmobject will
-            # be the end of the last dash
-            alphas /= 1 - full_d_alpha + partial_d_alpha
-
-            self.add(
-                *[
-                    vmobject.get_subcurve(alpha, alpha + partial_d_alpha)
-                    for alpha in alphas[:-1]
-                ]
-            )
-        # Family is already taken care of by get_subcurve
-        # implementation
+            # End points of the unit interval for division, rescaled
+            # so that the last point of vmobject will be the end of
+            # the last dash
+            scale = 1.0 / (1 - full_d_alpha + partial_d_alpha)
+            alphas = np.linspace(0, scale, num_dashes + 1)[:-1]
+            betas = alphas + partial_d_alpha
+
+            # The curves are shared by every dash
+            bezier_quads = vmobject.get_cubic_bezier_tuples_from_points(vmobject.points)
+            # Each dash is a copy of vmobject, keeping its class and family
+            dashes = [
+                vmobject.get_subcurve(alpha, beta, bezier_quads=bezier_quads)
+                for alpha, beta in zip(alphas, betas)
+            ]
+            # The dashes are all new VMobjects, so none of the
+            # checks done by add are needed
+            self.submobjects.extend(dashes)
+        # Family is already taken care of when making the dashes
         self.match_style(vmobject, family=False)
@@ -3,6 +3,7 @@
 __all__ = [
     "bezier",
     "partial_bezier_points",
+    "partial_bezier_points_batch",
     "interpolate",
     "integer_interpolate",
     "mid",
@@ -50,6 +51,38 @@ def partial_bezier_points(points, a, b):
     return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
 
 
+def partial_bezier_points_batch(curves, a, b):
+    """
+    Same as calling partial_bezier_points(curves[i], a[i], b[i])
+    for each i, but with all the curves computed at once.
+
+    curves is an array of shape (num_curves, num_points, dim),
+    and a and b are arrays of shape (num_curves,).
+    """
+    curves = np.asarray(curves)
+    a = np.reshape(a, (-1, 1, 1))
+    b = np.reshape(b, (-1, 1, 1))
+    num_points = curves.shape[1]
+    degree = num_points - 1
+    result = np.empty(curves.shape)
+    # The ith control point of the portion on [a, b] is the
+    # blossom of the curve at (degree - i) copies of a and
+    # i copies of b, which de Casteljau's algorithm computes
+    # when using a at the first levels and b at the rest.
+    # The levels using a are the same for every i, so they
+    # are only computed once.
+    a_levels = [curves]
+    for level in range(degree):
+        points = a_levels[-1]
+        a_levels.append((1 - a) * points[:, :-1] + a * points[:, 1:])
+    for i in range(num_points):
+        points = a_levels[degree - i]
+        for level in range(i):
+            points = (1 - b) * points[:, :-1] + b * points[:, 1:]
+        result[:, i] = points[:, 0]
+    return result
+
+
 # Linear interpolation variants
 
 
@@ -126,9 +159,8 @@ def get_smooth_handle_points(points):
     b[0] = points[0]
     b[-1] = points[-1]
 
-    def solve_func(b):
-        return linalg.solve_banded((l, u), diag, b)
-
+    # Each column of b is one coordinate, so all of them
+    # are solved for in a single call below
     use_closed_solve_function = is_closed(points)
     if use_closed_solve_function:
         # Get equations to relate first and last points
@@ -140,16 +172,9 @@ def get_smooth_handle_points(points):
         matrix[0, [0, -1]] = [1, 1]
         b[0] = 2 * points[0]
         b[-1] = np.zeros(dim)
-
-        def closed_curve_solve_func(b):
-            return linalg.solve(matrix, b)
-
-    handle_pairs = np.zeros((2 * num_handles, dim))
-    for i in range(dim):
-        if use_closed_solve_function:
-            handle_pairs[:, i] = closed_curve_solve_func(b[:, i])
-        else:
-            handle_pairs[:, i] = solve_func(b[:, i])
+        handle_pairs = linalg.solve(matrix, b)
+    else:
+        handle_pairs = linalg.solve_banded((l, u), diag, b)
     return handle_pairs[0::2], handle_pairs[1::2]
 
 
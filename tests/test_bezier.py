@@ -0,0 +1,17 @@
+import numpy as np
+from manim.utils.bezier import partial_bezier_points, partial_bezier_points_batch
+
+
+def test_partial_bezier_points_batch():
+    """Test that the batched version agrees with partial_bezier_points."""
+    curves = np.array(
+        [
+            [[0, 0, 0], [1, 2, 0], [3, 2, 0], [4, 0, 0]],
+            [[0, 0, 0], [0, 1, 1], [1, 1, 2], [2, 0, 1]],
+            [[1, 1, 1], [2, 2, 2], [3, 3, 3], [4, 4, 4]],
+        ]
+    )
+    a = np.array([0.25, 0, 1])
+    b = np.array([0.5, 1, 1])
+    expected = [partial_bezier_points(c, a1, b1) for c, a1, b1 in zip(curves, a, b)]
+    np.testing.assert_allclose(partial_bezier_points_batch(curves, a, b), expected)
@@ -50,6 +50,8 @@ def test_overlapping_family():
     assert mob in family
     assert len(family) == 6
     assert family.count(gchild_common) == 1
+    # The last occurrence of a repeated member is the one kept
+    assert family == [mob, child1, gchild1, child2, gchild2, gchild_common]
 
 
 def test_shift_family():
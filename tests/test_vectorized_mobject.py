@@ -1,5 +1,16 @@
 import pytest
-from manim import Mobject, VMobject, VGroup, VDict
+import numpy as np
+from manim import (
+    Mobject,
+    VMobject,
+    VGroup,
+    VDict,
+    Circle,
+    Square,
+    BackgroundRectangle,
+    CurvesAsSubmobjects,
+    DashedVMobject,
+)
 
 
 def test_vgroup_init():
@@ -64,3 +75,179 @@ def test_vdict_remove():
     assert len(obj.submob_dict) == 0
     with pytest.raises(KeyError):
         obj.remove("a")
+
+
+def test_vmobject_generate_rgbas_array():
+    """Test that colors and opacities of different lengths are stretched to match."""
+    obj = VMobject()
+    rgbas = obj.generate_rgbas_array(["#ff0000", "#0000ff"], [0.2, 0.4, 0.6])
+    np.testing.assert_allclose(
+        rgbas,
+        [[1, 0, 0, 0.2], [1, 0, 0, 0.4], [0, 0, 1, 0.6]],
+    )
+    obj.sheen_factor = 0.5
+    rgbas = obj.generate_rgbas_array("#ff0000", 0.3)
+    np.testing.assert_allclose(rgbas, [[1, 0, 0, 0.3], [1, 0.5, 0.5, 0.3]])
+    obj.sheen_factor = 0
+    rgbas = obj.generate_rgbas_array(np.array(["#ff0000", "#0000ff", "#00ff00"]), 1)
+    np.testing.assert_allclose(rgbas, [[1, 0, 0, 1], [0, 0, 1, 1], [0, 1, 0, 1]])
+
+
+def test_vmobject_family_set_fill():
+    """Test that setting the fill of a family gives every member its own rgbas."""
+    obj = VGroup(VMobject(), VGroup(VMobject(), VMobject()))
+    obj.set_fill("#ff0000", opacity=0.5)
+    for mob in obj.get_family():
+        np.testing.assert_allclose(mob.get_fill_rgbas(), [[1, 0, 0, 0.5]])
+    obj[0].set_fill(opacity=1)
+    np.testing.assert_allclose(obj[1][0].get_fill_rgbas(), [[1, 0, 0, 0.5]])
+
+
+def test_vmobject_match_style():
+    """Test that match_style copies colors and opacities over."""
+    obj1 = VMobject().set_fill(["#ff0000", "#00ff00"], opacity=0.5)
+    obj1.set_stroke("#0000ff", width=7, opacity=0.3)
+    obj2 = VMobject().match_style(obj1)
+    np.testing.assert_allclose(obj2.get_fill_rgbas(), obj1.get_fill_rgbas())
+    np.testing.assert_allclose(obj2.get_stroke_rgbas(), obj1.get_stroke_rgbas())
+    assert obj2.get_stroke_width() == 7
+    assert obj1.get_style()["fill_color"] == obj2.get_style()["fill_color"]
+
+
+def test_vmobject_points_from_proportions():
+    """Test that points_from_proportions agrees with point_from_proportion."""
+    obj = VMobject()
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 2, 0]])
+    obj.make_smooth()
+    alphas = [-0.5, 0, 0.2, 0.5, 0.73, 1, 1.5]
+    np.testing.assert_allclose(
+        obj.points_from_proportions(alphas),
+        [obj.point_from_proportion(a) for a in alphas],
+    )
+
+
+def test_vmobject_apply_function_shared_points():
+    """Test that apply_function leaves a points array shared with another mobject alone."""
+    obj1 = VMobject()
+    obj1.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    original_points = np.array(obj1.points)
+    obj2 = VMobject()
+    obj2.points = obj1.points
+    obj2.apply_function(lambda p: 2 * p)
+    np.testing.assert_allclose(obj1.points, original_points)
+    np.testing.assert_allclose(obj2.points, 2 * original_points)
+    # Integer points are converted rather than scaled in place
+    obj3 = VMobject()
+    obj3.points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [2, 1, 0]])
+    obj3.apply_function(lambda p: 2 * p)
+    np.testing.assert_allclose(obj3.points[-1], [4, 2, 0])
+
+
+def test_vmobject_shift_shared_points():
+    """Test that shift leaves a points array shared with another mobject alone."""
+    obj1 = VMobject()
+    obj1.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    original_points = np.array(obj1.points)
+    obj2 = VMobject()
+    obj2.points = obj1.points
+    obj2.shift([1, 0, 0])
+    np.testing.assert_allclose(obj1.points, original_points)
+    np.testing.assert_allclose(obj2.points, original_points + [1, 0, 0])
+
+
+def test_vmobject_points_dtype():
+    """Test that points keep the configured dtype as they are modified."""
+    obj = VMobject(points_dtype=np.float32)
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    assert obj.points.dtype == np.float32
+    obj.add_line_to([0, 1, 0])
+    obj.shift([1, 1, 1])
+    assert obj.points.dtype == np.float32
+    obj.rotate(1)
+    assert obj.points.dtype == np.float32
+    obj.scale(2)
+    assert obj.points.dtype == np.float32
+    assert VMobject().points.dtype == np.float64
+
+
+def test_vmobject_get_subpaths():
+    """Test that subpaths are split where consecutive curves do not meet."""
+    obj = VMobject()
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    obj.append_points(obj.points + [1, 1, 1])
+    assert len(obj.get_subpaths()) == 2
+    assert len(list(obj.gen_subpaths_from_points_2d(obj.points))) == 1
+
+
+def test_vmobject_get_subcurve():
+    """Test that get_subcurve copies the family and leaves the original alone."""
+    obj = VMobject()
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    obj.add(VMobject())
+    original_points = np.array(obj.points)
+    subcurve = obj.get_subcurve(0, 0.5)
+    np.testing.assert_allclose(subcurve.points[[0, -1]], [[0, 0, 0], [1, 0, 0]])
+    np.testing.assert_allclose(obj.points, original_points)
+    assert len(subcurve.submobjects) == 1
+    assert subcurve.submobjects[0] is not obj.submobjects[0]
+
+
+def test_vmobject_get_subcurve_overridden_partial():
+    """Test that get_subcurve keeps the points when pointwise_become_partial is overridden."""
+    rect = BackgroundRectangle(Square())
+    subcurve = rect.get_subcurve(0.2, 0.6)
+    np.testing.assert_allclose(subcurve.points, rect.points)
+
+    class OpacityOnlyPartial(VMobject):
+        def pointwise_become_partial(self, mobject, a, b):
+            self.set_stroke(opacity=b)
+            return self
+
+    obj = OpacityOnlyPartial()
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    subcurve = obj.get_subcurve(0, 0.5)
+    np.testing.assert_allclose(subcurve.points, obj.points)
+    assert subcurve.get_stroke_opacity() == 0.5
+    dashed = DashedVMobject(obj, num_dashes=3)
+    assert len(dashed.submobjects) == 3
+
+
+def test_dashed_vmobject():
+    """Test that dashes are partial copies of the vmobject, keeping its class and style."""
+    circle = Circle().set_stroke("#ff0000", width=6).set_shade_in_3d()
+    dashed = DashedVMobject(circle, num_dashes=5)
+    assert len(dashed.submobjects) == 5
+    for dash in dashed.submobjects:
+        assert isinstance(dash, Circle)
+        assert dash.shade_in_3d
+        assert dash.get_stroke_width() == 6
+        np.testing.assert_allclose(dash.get_stroke_rgbas(), circle.get_stroke_rgbas())
+    np.testing.assert_allclose(dashed.submobjects[0].points[0], circle.points[0])
+    for dash in dashed.submobjects:
+        assert dash.get_num_curves() > 0
+        np.testing.assert_allclose(
+            np.linalg.norm(dash.get_anchors(), axis=1), 1, atol=1e-3
+        )
+
+    group = VGroup(Circle(), Square())
+    dashed = DashedVMobject(group, num_dashes=3)
+    for dash in dashed.submobjects:
+        assert isinstance(dash, VGroup)
+        assert len(dash.submobjects) == 2
+        for sm1, sm2 in zip(dash.submobjects, group.submobjects):
+            assert sm1 is not sm2
+            assert type(sm1) is type(sm2)
+            np.testing.assert_allclose(sm1.points, sm2.points)
+
+
+def test_curves_as_submobjects():
+    """Test that each curve becomes a part with the style of the vmobject."""
+    circle = Circle().set_fill("#0000ff", opacity=0.5).set_stroke(width=3)
+    parts = CurvesAsSubmobjects(circle)
+    curves = circle.get_cubic_bezier_tuples()
+    assert len(parts.submobjects) == len(curves)
+    for part, curve in zip(parts.submobjects, curves):
+        np.testing.assert_allclose(part.points, curve)
+        np.testing.assert_allclose(part.get_fill_rgbas(), circle.get_fill_rgbas())
+        np.testing.assert_allclose(part.get_stroke_rgbas(), circle.get_stroke_rgbas())
+        assert part.get_stroke_width() == 3